@@ -1,10 +1,10 @@
 from __future__ import annotations
-from tkinter import ttk
-from _tkinter import TkappType
 from typing import TYPE_CHECKING
-import tkinter as tk
+from ..signals import signal
+import tkinter as tk, warnings
 
 if TYPE_CHECKING:
+    from _tkinter import TkappType
     from typing import Any, Type
 
     _StringDict = dict[str, Any]
@@ -12,21 +12,6 @@ if TYPE_CHECKING:
 # Classes
 #
 
-class _ResourceManager:
-    __slots__ = ('resources',)
-
-    def __init__(self, **kw: Any):
-        self.resources: _StringDict = {k: v for k, v in kw.items()}
-
-    def __getitem__(self, key: str, /) -> Any:
-        return self.resources[key]
-
-    def __setitem__(self, key: str, value: Any, /) -> None:
-        self.resources[key] = value
-
-    def __contains__(self, key: str) -> bool:
-        return self.resources.__contains__(key)
-
 class Variable(tk.Variable):
     """
     Class to define value holders for widgets.
@@ -35,6 +20,8 @@ class Variable(tk.Variable):
        Instead, use one of its subclasses.
     """
 
+    __slots__ = ('temp',)
+
     def __init__(self, master=None, value=None, name=None, temp=False):
         """
         Initialize the variable.
@@ -70,6 +57,8 @@ class Variable(tk.Variable):
 class BooleanVar(Variable):
     """Value holder for boolean variables."""
 
+    __slots__ = ('_getboolean',)
+
     _default = False
 
     def __init__(self, master=None, value=None,
@@ -87,11 +76,12 @@ class BooleanVar(Variable):
         :param temp: see :paramref:`Variable.temp`
         """
         super().__init__(master, value, name, temp)
+        tk: TkappType = self._tk # pyright: ignore
+        self._getboolean = tk.getboolean
 
     def get(self):
         """Return value of variable as string."""
-        tk: TkappType = self.tk
-        return tk.getboolean(super().get())
+        return self._getboolean(self._tk.globalgetvar(self._name)) # pyright: ignore
 
     def set(self, value):
         """
@@ -100,8 +90,10 @@ class BooleanVar(Variable):
         :param Any value: Any value that is understood
                           by Tcl as a boolean
         """
-        tk: TkappType = self.tk
-        return super().set(tk.getboolean(value))
+        # Called by tk.Variable.__init__, so self._getboolean
+        # may not exist yet
+        tk: TkappType = self._tk # pyright: ignore
+        return tk.globalsetvar(self._name, tk.getboolean(value)) # pyright: ignore
 
     initialize = set
 
@@ -114,6 +106,8 @@ class StringVar(Variable):
     some string
     """
 
+    __slots__ = ('_globalgetvar',)
+
     def __init__(self, master=None, value=None, name=None, temp=False):
         """
         Construct a string variable.
@@ -129,31 +123,89 @@ class StringVar(Variable):
         :param temp: see :paramref:`Variable.temp`
         """
         super().__init__(master, value, name, temp)
+        self._globalgetvar = self.tk.globalgetvar
 
     def get(self) -> str:
         """Return value of variable as string."""
-        value: Any = self.tk.globalgetvar(self._name) # pyright: ignore
-        if isinstance(value, str):
-            return value
-        return str(value)
+        value: Any = self._globalgetvar(self._name) # pyright: ignore
+        return value if type(value) is str else str(value)
+
+# Names of the geometry methods that composite widgets forward to their frame
+_GEOMETRY_METHODS = frozenset(
+    m for m in vars(tk.Pack).keys() | vars(tk.Grid).keys() | vars(tk.Place).keys()
+    if m[0] != "_" and m not in ("config", "configure")
+)
+
+class _FrameMethod:
+    """Descriptor that looks up a method on the instance's frame."""
+
+    __slots__ = ('owner', 'name')
+
+    def __init__(self, owner: type, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any=None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            frame = instance.frame
+        except AttributeError:
+            # No frame, use the widget's own method
+            return getattr(super(self.owner, instance), self.name)
+
+        return getattr(frame, self.name)
+
+class _LazySignal:
+    """Descriptor that creates a signal the first time it is accessed."""
+
+    __slots__ = ('name', 'attr')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.attr = ""
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, instance: Any, owner: Any=None) -> Any:
+        if instance is None:
+            return self
+
+        # Store the signal on the instance so this is only called once
+        sig = instance.__dict__[self.attr] = signal(self.name, instance)
+        return sig
 
 class _WidgetMixin: # pyright: ignore
+    def __init_subclass__(cls, **kw: Any) -> None:
+        super().__init_subclass__(**kw)
+
+        # Methods defined by the widget class itself are not overridden;
+        # forwarders installed on a parent class do not count as such
+        widget_methods = set()
+        for base in cls.__mro__:
+            if base is tk.Widget:
+                break
+            widget_methods.update(k for k, v in vars(base).items()
+                                  if not isinstance(v, _FrameMethod))
+
+        # Point geometry methods to those of the frame (self.frame)
+        cls._forwarded_methods = tuple(sorted(_GEOMETRY_METHODS.difference(widget_methods)))
+        for m in cls._forwarded_methods:
+            setattr(cls, m, _FrameMethod(cls, m))
+
     def override_geomtry_methods(self, cls: Type[tk.Widget]) -> None:
         """
         Overrides self's geometry methods to point to its parent's.
 
-        The parent of this widget shall be the frame (self.frame).
+        .. deprecated:: 0.2
+           Geometry methods are forwarded to the frame (self.frame)
+           when the class is defined, so this does nothing.
         """
-        frame: ttk.Frame = getattr(self, 'frame')
-
-        # HACK: Copy geometry methods of self.frame without overriding other methods
-        widget_methods = vars(cls).keys()
-        methods = vars(tk.Pack).keys() | vars(tk.Grid).keys() | vars(tk.Place).keys()
-        methods = methods.difference(widget_methods)
-
-        for m in methods:
-            if m [0] != "_" and m not in ("config", "configure"):
-                setattr(self, m, getattr(frame, m))
+        warnings.warn("override_geomtry_methods() does nothing and will be removed; "
+                      "geometry methods are forwarded when the class is defined",
+                      DeprecationWarning, stacklevel=2)
 
     def __str__(self) -> str:
         return self.frame.__str__() # pyright: ignore
@@ -163,12 +215,21 @@ class _WidgetMixin: # pyright: ignore
 
     def set_custom_resources(self, **kw: Any) -> None:
         """Set custom resources in the resource manager."""
-        self.__options = _ResourceManager(**kw)
+        self.__options: _StringDict = kw
 
     def set_custom_resource(self, name: str, value: Any) -> None:
         """Set the resource NAME to VALUE."""
         self.__options[name] = value
 
+    def update_custom_resource(self, name: str, value: Any) -> bool:
+        """Set the resource NAME to VALUE and return true if it changed."""
+        options = self.__options
+        if name in options and options[name] == value:
+            return False
+
+        options[name] = value
+        return True
+
     def get_custom_resource(self, name: str) -> Any:
         """Get the resource associated with NAME."""
         return self.__options[name]
@@ -180,35 +241,26 @@ class _WidgetMixin: # pyright: ignore
     # Metadata functions
     #
 
-    def __check_metatable_exists(self):
-        try:
-            temp = self.__metadata # pyright: ignore
-        except:
-            self.__metadata: _StringDict = {}
+    def _meta(self) -> _StringDict:
+        # Return the metadata table, creating it on first use
+        d = self.__dict__.get('_WidgetMixin__metadata')
+        if d is None:
+            d = self.__dict__['_WidgetMixin__metadata'] = {}
+        return d
 
     def set_meta(self, key: str, value: Any) -> None:
         """Set the meta field KEY to VALUE."""
-        # if not hasattr(self, '__metadata'):
-        #     self.__metadata: _StringDict = {}
-
-        self.__check_metatable_exists()
-
         if not isinstance(key, str):
             raise TypeError("key must be a string")
 
-        self.__metadata[key] = value
+        self._meta()[key] = value
 
     def get_meta(self, key: str, default: Any=None) -> Any:
         """Get the meta field KEY, or DEFAULT if it does not exist."""
-        # if not hasattr(self, '__metadata'):
-        #     self.__metadata: _StringDict = {}
-
-        self.__check_metatable_exists()
-
         if not isinstance(key, str):
             raise TypeError("key must be a string")
 
-        return self.__metadata.get(key, default)
+        return self._meta().get(key, default)
 
 class _StateMethods:
     def state(self, state_spec=None):
@@ -262,6 +314,8 @@ class TkBusyCommand(tk.Widget):
     status is handled automatically.
     """
 
+    __slots__ = ('_root', '_tk', '_widget', '_held')
+
     def __init__(self, master, window, /):
         """
         Construct a TkBusyCommand object.
@@ -275,23 +329,54 @@ class TkBusyCommand(tk.Widget):
         self._root = master
         self._tk = self._root.tk
         self._widget = window
+        self._held = False
 
-    def forget(self) -> None:
-        """Release the busy-hold on the widget and its descendents."""
-        if self.is_busy:
-            self._tk.call('tk', 'busy', 'forget', self._widget)
-            self._tk.call('update')
+    def forget(self, full_update: bool=False) -> None:
+        """
+        Release the busy-hold on the widget and its descendents.
+
+        :param bool full_update: If true, process all pending events
+                                 afterwards, not just idle tasks
+        """
+        if self._held:
+            _call = self._tk.call
+            _call('tk', 'busy', 'forget', self._widget)
+            if full_update:
+                _call('update')
+            else:
+                _call('update', 'idletasks')
+            self._held = False
+
+    def hold(self, full_update: bool=False) -> None:
+        """
+        Make the window and its descendants appear busy.
 
-    def hold(self) -> None:
-        """Make the window and its descendants appear busy."""
-        if not self.is_busy:
-            self._tk.call('tk', 'busy', 'hold', self._widget)
-            self._tk.call('update')
+        :param bool full_update: If true, process all pending events
+                                 afterwards, not just idle tasks
+        """
+        if not self._held:
+            _call = self._tk.call
+            _call('tk', 'busy', 'hold', self._widget)
+            if full_update:
+                _call('update')
+            else:
+                _call('update', 'idletasks')
+            self._held = True
 
     @property
     def is_busy(self) -> bool:
         """True if the window is busy."""
-        return tk.getboolean(self._tk.call('tk', 'busy', 'status', self._widget))
+        return self._held
+
+    def query_is_busy(self) -> bool:
+        """
+        Query Tk for whether the window is busy.
+
+        Unlike :py:attr:`is_busy`, this notices if the window
+        was marked busy or released outside of this object.
+        """
+        self._held = self._tk.getboolean(self._tk.call('tk', 'busy', 'status', self._widget))
+        return self._held
 
     def __enter__(self):
         self.hold()
@@ -313,6 +398,8 @@ class InState:
            ...
     """
 
+    __slots__ = ('owner', 'state_spec', 'old_state')
+
     def __init__(self, owner, state_spec):
         """
         Create an object to change the state of `owner`.
@@ -330,16 +417,12 @@ class InState:
         self.state_spec = state_spec
         self.old_state = ()
 
-        if state_spec in ['normal', 'disabled']:
+        if state_spec == 'normal' or state_spec == 'disabled':
             self.old_state = 'normal' if state_spec == 'disabled' else 'disabled'
         else:
-            flags = []
-            for st in state_spec:
-                flags.append(
-                    f"!{st}" if not st.startswith("!") else st[1:]
-                )
-
-            self.old_state = tuple(flags)
+            self.old_state = tuple(
+                st[1:] if st.startswith("!") else f"!{st}" for st in state_spec
+            )
 
     def __enter__(self):
         self.owner.state(self.state_spec)
@@ -53,6 +53,9 @@ class _WidgetMixin:
     def set_custom_resource(self, key: str, value: Any) -> None:
         ...
 
+    def update_custom_resource(self, key: str, value: Any) -> bool:
+        ...
+
     def get_custom_resource(self, key: str) -> Any:
         ...
 
@@ -85,16 +88,19 @@ class TkBusyCommand(Widget):
     def __init__(self, master: Widget, window: Widget, /) -> None:
         ...
 
-    def forget(self) -> None:
+    def forget(self, full_update: bool=...) -> None:
         ...
 
-    def hold(self) -> None:
+    def hold(self, full_update: bool=...) -> None:
         ...
 
     @property
     def is_busy(self) -> bool:
         ...
 
+    def query_is_busy(self) -> bool:
+        ...
+
     def __enter__(self) -> Self:
         ...
 
@@ -1,37 +1,87 @@
 from __future__ import annotations
 # from .data import ERROR_ICON_PNG
-from PIL import Image, ImageTk
 from pathlib import Path
-import functools, io
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+import io
+import tkinter as tk
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
 
 # IMAGE_DATA = {
 #     'error': ERROR_ICON_PNG
 # }
 
-# ROOTDIR = Path(__file__).parent
+_IMG_DIR = Path(__file__).parent
+
+IMAGE_FILES = MappingProxyType({
+    'error': _IMG_DIR / "error.png",
+    'info': _IMG_DIR / "info.png"
+})
+
+_pil_images: dict[str, Image.Image] = {}
+# PhotoImages by root, then by name. Roots are held weakly so that
+# entries go away with their interpreter and are never handed to a
+# new root that happens to reuse the id of a destroyed one.
+_photo_images: WeakKeyDictionary[tk.Misc, dict[str, ImageTk.PhotoImage]] = WeakKeyDictionary()
+
+def _load_pil(name: str, /) -> Image.Image:
+    # Read and decode the image NAME. The result does not depend
+    # on a Tk interpreter, so it is shared by all of them.
+    img = _pil_images.get(name)
+    if img is not None:
+        return img
+
+    from PIL import Image
+
+    try:
+        image_file = IMAGE_FILES[name]
+        # data = IMAGE_DATA[name]
+    except KeyError:
+        raise ValueError(f"Unknown image {name!r}") from None
+
+    data = image_file.read_bytes()
+
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    _pil_images[name] = img
 
-IMAGE_FILES = {
-    'error': "error.png",
-    'info': "info.png"
-}
+    return img
 
-@functools.cache
-def load_image(name: str, /):
+def load_image(name: str, /, root: tk.Misc | None=None):
     """
     Load an image with the given NAME.
 
     NAME can be one of the following:
     - error
+    - info
+
+    The image is created for the root window of ROOT, or the
+    default root if ROOT is None. It is cached for each NAME
+    and root window.
+
+    RuntimeError is raised if ROOT is None and there is no
+    default root.
     """
-    try:
-        image_file = Path(__file__).parent / IMAGE_FILES[name]
-        data = image_file.read_bytes()
-        # data = IMAGE_DATA[name]
-    except:
-        raise ValueError(f"Unknown image {name!r}")
+    from PIL import ImageTk
+
+    if root is None:
+        # tkinter._get_default_root does this check, but it is
+        # not available before Python 3.10
+        root = tk._default_root # pyright: ignore
+        if root is None:
+            raise RuntimeError("load_image needs a root window")
+    else:
+        root = root._root()
+
+    photos = _photo_images.get(root) # pyright: ignore
+    if photos is None:
+        photos = _photo_images[root] = {} # pyright: ignore
 
-    with io.BytesIO(data) as fd:
-        img = Image.open(fd)
-        img.load()
+    photo = photos.get(name)
+    if photo is None:
+        photo = photos[name] = ImageTk.PhotoImage(_load_pil(name), master=root)
 
-    return ImageTk.PhotoImage(img)
+    return photo
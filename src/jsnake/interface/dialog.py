@@ -17,29 +17,72 @@ from tkinter import (
 from tkinter.simpledialog import _setup_dialog # pyright: ignore
 from typing import TYPE_CHECKING, cast, Callable
 from ._images import load_image
-from ..logging import get_logger
-import re, functools
+from ..logging import get_logger, Level
+import asyncio
 
 if TYPE_CHECKING:
     from typing import Any, Optional
 
+# Tcl lambda that sets up a dialog's window in one call.
+# Arguments are passed as values so they need no quoting.
+_WM_SETUP_LAMBDA = """{w command parent title} {
+    wm withdraw $w
+    wm protocol $w WM_DELETE_WINDOW $command
+    if {$parent ne ""} {wm transient $w $parent}
+    if {$title ne ""} {wm title $w $title}
+}"""
+
+# Message box types
+_VALID_TYPES = frozenset({
+    "abortretryignore", "ok", "okcancel", "retrycancel", "yesno", "yesnocancel"
+})
+
+# Default button for each message box type
+_SENSIBLE_DEFAULT = {
+    "abortretryignore": "abort",
+    "ok": "ok",
+    "okcancel": "ok",
+    "retrycancel": "retry",
+    "yesno": "yes",
+    "yesnocancel": "yes"
+}
+
+# Valid default buttons
+_VALID_DEFAULTS = frozenset({"abort", "ignore", "retry", "yes", "no", "ok", "cancel"})
+_VALID_DEFAULTS_SORTED = ", ".join(sorted(_VALID_DEFAULTS))
+
+# Button labels for each message box type
+_BUTTON_SPECS: dict[str, tuple[str, ...]] = {
+    "abortretryignore": ("Abort", "Retry", "Ignore"),
+    "ok": ("OK",),
+    "okcancel": ("OK", "Cancel"),
+    "retrycancel": ("Retry", "Cancel"),
+    "yesno": ("Yes", "No"),
+    "yesnocancel": ("Yes", "No", "Cancel")
+}
+
 class ExDialog(Toplevel):
     """A base class for all dialogs."""
 
+    __slots__ = ('parent', 'initial_focus', '_owns_temp_root', '_destroyed')
+
     def __init__(self, parent=None, *, title=None, _parallel=False):
         master = parent or _get_temp_root()
         self.master = master
+        self._owns_temp_root = parent is None
+        self._destroyed = False
 
         Toplevel.__init__(self, master, class_="Dialog")
 
-        self.withdraw() # remain invisible while we figure out the geometry
-
+        # Remain invisible while we figure out the geometry, and
+        # cancel the dialog when it is closed
         parent = cast(Tk | None, parent)
+        transient_for = ""
         if parent is not None and parent.winfo_viewable():
-            self.wm_transient(parent)
+            transient_for = str(parent)
 
-        if title:
-            self.title(title)
+        self.tk.call('apply', _WM_SETUP_LAMBDA, self, self._register(self.cancel),
+                     transient_for, title or "")
 
         _setup_dialog(self)
 
@@ -57,8 +100,6 @@ class ExDialog(Toplevel):
 
         self.buttonbox()
 
-        self.protocol("WM_DELETE_WINDOW", self.cancel)
-
         _place_window(self, parent)
 
         self.initial_focus.focus_set()
@@ -72,8 +113,24 @@ class ExDialog(Toplevel):
     def destroy(self):
         """Destroy the window."""
         self.initial_focus = None
+        self._destroyed = True
         Toplevel.destroy(self)
-        _destroy_temp_root(self.master)
+        if self._owns_temp_root:
+            _destroy_temp_root(self.master)
+
+    async def wait_async(self, interval: float=0.05):
+        """
+        Wait for the dialog to be destroyed without blocking the event loop.
+
+        :param float interval: The number of seconds to sleep
+                               between checks
+
+        This is meant for non-blocking dialogs in applications
+        that run Tk from an asyncio event loop. Tk events must
+        still be processed by the application while waiting.
+        """
+        while not self._destroyed:
+            await asyncio.sleep(interval)
 
     # Construction hooks
     #
@@ -95,13 +152,11 @@ class ExDialog(Toplevel):
         """Called by :py:meth:`__init__` to create the buttons."""
         box = ttk.Frame(self)
 
-        BUTTON_PACK_OPTS = dict(side=LEFT, padx=5, pady=5)
-
         ttk.Button(box, text="OK", command=self.ok,
-                   default=ACTIVE).pack(BUTTON_PACK_OPTS)
+                   default=ACTIVE).pack(side=LEFT, padx=5, pady=5)
 
         ttk.Button(box, text="Cancel",
-                   command=self.cancel).pack(BUTTON_PACK_OPTS)
+                   command=self.cancel).pack(side=LEFT, padx=5, pady=5)
 
         self.bind("<Return>", self.ok)
         self.bind("<Escape>", self.cancel)
@@ -157,46 +212,56 @@ class ExDialog(Toplevel):
         """
         pass
 
+# Tcl lambda used by _place_window. Without a mapped parent it lets
+# ::tk::PlaceWindow center the window on the screen and returns an
+# empty list. Otherwise it actualizes the geometry of the window and
+# returns everything _place_window needs from winfo in one call.
+_PLACE_INFO_LAMBDA = """{w parent} {
+    if {$parent eq "" || ![winfo ismapped $parent]} {
+        wm maxsize $w [winfo vrootwidth $w] [winfo vrootheight $w]
+        ::tk::PlaceWindow $w center
+        return {}
+    }
+    update idletasks
+    return [list [winfo reqwidth $w] [winfo reqheight $w] \\
+        [winfo vrootwidth $w] [winfo vrootheight $w] \\
+        [winfo rootx $parent] [winfo rooty $parent] \\
+        [winfo width $parent] [winfo height $parent] \\
+        [winfo vrootx $w] [winfo vrooty $w]]
+}"""
+
 # Place a toplevel window at the center of parent or screen
 # It is a Python implementation of ::tk::PlaceWindow.
+# The window is expected to be withdrawn already.
 def _place_window(w: Toplevel, parent: Optional[Tk]=None):
-    w.wm_withdraw() # Remain invisible while we figure out the geometry
-    w.update_idletasks() # Actualize geometry information
-
-    logger = get_logger(__name__)
+    info = w.tk.splitlist(w.tk.call('apply', _PLACE_INFO_LAMBDA, w,
+                                    "" if parent is None else parent))
+    if not info:
+        # Tk centered the window on the screen
+        return
 
-    minwidth = w.winfo_reqwidth()
-    minheight = w.winfo_reqheight()
-    maxwidth = w.winfo_vrootwidth()
-    maxheight = w.winfo_vrootheight()
+    (minwidth, minheight, maxwidth, maxheight,
+     px, py, pwidth, pheight, vrootx, vrooty) = map(int, info)
 
-    logger.debug("Min size: (%d, %d)", minwidth, minheight)
-    logger.debug("Max size: (%d, %d)", maxwidth, maxheight)
+    # Center on the parent
+    x = px + (pwidth - minwidth) // 2
+    y = py + (pheight - minheight) // 2
+    initial = (x, y)
 
-    if parent is not None and parent.winfo_ismapped():
-        x = parent.winfo_rootx() + (parent.winfo_width() - minwidth) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - minheight) // 2
+    x = min(x, vrootx + maxwidth - minwidth)
+    x = max(x, vrootx)
+    y = min(y, vrooty + maxheight - minheight)
+    y = max(y, vrooty)
 
-        vrootx = w.winfo_vrootx()
-        vrooty = w.winfo_vrooty()
+    if w._windowingsystem == 'aqua':
+        # Avoid the native menu bar which sits on top of everything.
+        y = max(y, 22)
 
-        logger.debug("Inital xy: (%d, %d). Xroot xy: (%d, %d)", x, y, vrootx, vrooty)
-
-        x = min(x, vrootx + maxwidth - minwidth)
-        x = max(x, vrootx)
-        y = min(y, vrooty + maxheight - minheight)
-        y = max(y, vrooty)
-
-        logger.debug("Calculated xy: (%d, %d)", x, y)
-
-        if w._windowingsystem == 'aqua':
-            # Avoid the native menu bar which sits on top of everything.
-            y = max(y, 22)
-    else:
-        x = (w.winfo_screenwidth() - minwidth) // 2
-        y = (w.winfo_screenheight() - minheight) // 2
-
-        logger.debug("Calculated xy: (%d, %d)", x, y)
+    logger = get_logger(__name__)
+    if logger.isEnabledFor(Level.DEBUG):
+        logger.debug("Min size: (%d, %d). Max size: (%d, %d). Initial xy: %s. "
+                     "Calculated xy: (%d, %d)", minwidth, minheight, maxwidth,
+                     maxheight, initial, x, y)
 
     w.wm_maxsize(maxwidth, maxheight)
     # Become visible at the desired location
@@ -206,6 +271,8 @@ def _place_window(w: Toplevel, parent: Optional[Tk]=None):
 class ExMessagebox(ExDialog):
     """Message box."""
 
+    __slots__ = ('type', 'icon', 'message', 'details', 'command', 'result', 'default')
+
     def __init__(self, parent=None, *,
                  command=None,
                  default=None,
@@ -215,8 +282,7 @@ class ExMessagebox(ExDialog):
                  title=None,
                  type="ok"):
         # Type
-        PATTERN = r"abortretryignore|ok(?:cancel)?|retrycancel|yesno(?:cancel)?"
-        if not re.match(PATTERN, type):
+        if type not in _VALID_TYPES:
             values = "abortretryignore, ok, okcancel, retrycancel, yesno, or yesnocancel"
             raise ValueError(f"Invalid type '{type}': must be {values}")
         self.type = type
@@ -237,9 +303,8 @@ class ExMessagebox(ExDialog):
         self.result: str = "" #: The symbolic name of the clicked button
 
         # Default
-        VALID_DEFAULTS = ["abort", "ignore", "retry", "yes", "no", "ok", "cancel"]
-        if default and default not in VALID_DEFAULTS:
-            raise ValueError(f"Invalid default {default!r}: can be one of {', '.join(sorted(VALID_DEFAULTS))}")
+        if default and default not in _VALID_DEFAULTS:
+            raise ValueError(f"Invalid default {default!r}: can be one of {_VALID_DEFAULTS_SORTED}")
 
         self.default = default or self._get_sensible_default(self.type)
 
@@ -248,13 +313,10 @@ class ExMessagebox(ExDialog):
 
     @staticmethod
     def _get_sensible_default(string: str):
-        PATTERN = r"(abort|ok|retry|yes).*"
-        m = re.match(PATTERN, string)
-        assert m is not None
-        return m[1]
+        return _SENSIBLE_DEFAULT[string]
 
     def body(self, body: ttk.Frame):
-        icon = ttk.Label(body, image=load_image(self.icon))
+        icon = ttk.Label(body, image=load_image(self.icon, root=self))
 
         msg = ttk.Label(body, text=self.message, anchor=NW, justify=LEFT)
 
@@ -267,39 +329,7 @@ class ExMessagebox(ExDialog):
     def buttonbox(self):
         box = ttk.Frame(self)
 
-        BUTTON_PACK_OPTS = dict(side=LEFT, padx=5, pady=5)
-        BUTTON_EXTRA_OPTS = dict(default=ACTIVE)
-
-        button_specs: list[str] = []
-
-        CANCEL = "Cancel"
-        OK = "OK"
-        YES = "Yes"
-        NO = "No"
-
-        match self.type:
-            case "okcancel" | "ok" as n:
-                button_specs.append(OK)
-                if "cancel" in n:
-                    button_specs.append(CANCEL)
-
-            case "abortretryignore":
-                button_specs = [
-                    "Abort",
-                    "Retry",
-                    "Ignore"
-                ]
-
-            case "retrycancel":
-                button_specs = ["retry", CANCEL]
-
-            case "yesno" | "yesnocancel" as n:
-                button_specs = [YES, NO]
-                if "cancel" in n:
-                    button_specs.append(CANCEL)
-
-            case _:
-                raise Exception("Unreachable code")
+        button_specs = _BUTTON_SPECS[self.type]
 
         def _set_result(value: str) -> None:
             self.result = value
@@ -308,13 +338,15 @@ class ExMessagebox(ExDialog):
         buttons: dict[str, ttk.Button] = {}
 
         # Buttons
-        for label, func in button_specs:
+        for label in button_specs:
             symname = label.lower()
-            opts = BUTTON_EXTRA_OPTS if self.default == symname else {}
 
-            fn = functools.partial(_set_result, symname)
-            btn = ttk.Button(box, text=label, command=fn, **opts)
-            btn.pack(BUTTON_PACK_OPTS)
+            fn = lambda value=symname: _set_result(value)
+            if self.default == symname:
+                btn = ttk.Button(box, text=label, command=fn, default=ACTIVE)
+            else:
+                btn = ttk.Button(box, text=label, command=fn)
+            btn.pack(side=LEFT, padx=5, pady=5)
 
             buttons[symname] = btn
 
@@ -356,11 +388,10 @@ def test():
         # For each type of dialog, two buttons are created, one for
         # blocking dialogs and one or non-blocking.
         ttk.Button(lfBlocking, text=_type.capitalize(),
-                   command=functools.partial(_show_dialog, _type)).pack()
+                   command=lambda t=_type: _show_dialog(t)).pack()
 
         ttk.Button(lfNonblocking, text=_type.capitalize(),
-                   command=functools.partial(_show_dialog, _type,
-                       _dialog_callback)).pack()
+                   command=lambda t=_type: _show_dialog(t, _dialog_callback)).pack()
 
     ttk.Button(root, text="Exit", command=root.quit).pack()
 
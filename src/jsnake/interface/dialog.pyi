@@ -11,6 +11,9 @@ class ExDialog(Toplevel):
     def destroy(self) -> None:
         ...
 
+    async def wait_async(self, interval: float=...) -> None:
+        ...
+
     def body(self, body: ttk.Frame) -> Misc | None:
         ...
 
@@ -3,15 +3,58 @@ from tkinter import ttk
 from ..signals import signal
 from . import _WidgetMixin
 from typing import TYPE_CHECKING
-import tkinter as tk, sys
+import tkinter as tk, sys, weakref
 
 if TYPE_CHECKING:
     from typing import Any, Literal
     from .utils import _Widget
 
+_FOCUS_REASONS = frozenset({'focusin', 'focusout'})
+
+# Tcl command shared by every ExEntry in an interpreter for validation
+_VALIDATE_COMMAND = '::jsnake::validate_entry'
+
+def _register_validate_command(widget: tk.Misc) -> None:
+    # Create the validation command in WIDGET's interpreter unless
+    # an earlier entry already did
+    tkapp = widget.tk
+    if tkapp.call('info', 'commands', _VALIDATE_COMMAND):
+        return
+
+    # Hold the root weakly so the command does not keep it alive
+    root = widget._root()
+    root_ref = weakref.ref(root)
+
+    def _validate_entry_trampoline(path: str, reason: str, old_text: str,
+                                   new_text: str) -> bool:
+        # Route the validation to the entry named by PATH
+        root = root_ref()
+        if root is None:
+            return True
+        entry = root.nametowidget(path)
+        return entry._validate_entry(reason, old_text, new_text)
+
+    tkapp.call('namespace', 'eval', '::jsnake', '')
+    tkapp.createcommand(_VALIDATE_COMMAND, _validate_entry_trampoline)
+
+    # Let the root delete the command when it is destroyed
+    if root._tclCommands is None:
+        root._tclCommands = []
+    root._tclCommands.append(_VALIDATE_COMMAND)
+
+# Where each optional part of the entry is gridded inside its frame
+_PART_GRID_OPTS: dict[str, dict[str, Any]] = {
+    'label': {'row': 0, 'column': 0},
+    'xbar': {'row': 1, 'column': 1, 'sticky': 'ew'},
+    'clearbutton': {'row': 0, 'column': 2}
+}
+
 class ExEntry(ttk.Entry, _WidgetMixin):
     """Extended entry widget."""
 
+    # Options handled by the widget instead of Tk
+    _CUSTOM_KEYS = frozenset({'scrollx', 'label', 'clearbutton'})
+
     def __init__(self, master: _Widget=None, *, scrollx: bool=False,
                  label: str | None=None, clearbutton: bool=False, **kw: Any):
         """
@@ -46,24 +89,24 @@ class ExEntry(ttk.Entry, _WidgetMixin):
         # Frame this enter goes inside
         self.frame = ttk.Frame(master, padding='0 0 0 16')
 
-        # Label that displays the contents of the label property
-        self.label = ttk.Label(self.frame, text=label or "")
+        # The label, scrollbar and clear button are created on first use
+        self._label: ttk.Label | None = None
+        self._xbar: ttk.Scrollbar | None = None
+        self._clearbutton: ttk.Button | None = None
 
-        # X scrollbar
-        self.xbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.xview)
-
-        # Button that clears the text
-        self.clearbutton = ttk.Button(self.frame, text="X", command=self.clear, width=2)
-
-        # Bind the X scroll command to the scrollbar
-        kw['xscrollcommand'] = self.xbar.set
+        # Whether the clear button is enabled
+        self._clearbutton_state: bool | None = None
 
         super().__init__(self.frame, **kw)
 
+        # Layout changes waiting for the next idle callback
+        self._pending_layout: dict[str, bool] = {}
+        self._layout_after_id: str | None = None
+
         # Add validation to entry
+        _register_validate_command(self)
         self.config(validate="all",
-                    validatecommand=(self.register(self.__validate_entry),
-                                     '%V', '%P'))
+                    validatecommand=(_VALIDATE_COMMAND, '%W', '%V', '%s', '%P'))
 
         self.entry_name = ttk.Entry.__str__(self)
 
@@ -71,35 +114,109 @@ class ExEntry(ttk.Entry, _WidgetMixin):
         self.set_custom_resources(scrollx=scrollx, label=label, clearbutton=clearbutton)
 
         # Pack the entry
-        self.grid(row=0, column=1)
-
-        # Emit signals so that the program can react to the initialized options
-        self.on_x_scrollbar_changed.emit(scrollx)
-        self.on_label_changed.emit(label or "")
-        self.on_clearbutton_changed.emit(clearbutton)
-        self.on_text_changed.emit("")
-
-        self.override_geomtry_methods(ttk.Entry)
+        super().grid(row=0, column=1)
+
+        # Lay out the widgets according to the initial options
+        self._apply_initial_state(scrollx, label, clearbutton)
+
+    def _apply_initial_state(self, scrollx: bool, label: str | None,
+                             clearbutton: bool) -> None:
+        # Nothing inside the frame is mapped yet, so grid the enabled
+        # widgets back-to-back instead of emitting each signal
+        self._mapped_parts: set[str] = set()
+        if label:
+            self.label.configure(text=label)
+
+        for part, enabled in (('label', label), ('xbar', scrollx),
+                              ('clearbutton', clearbutton)):
+            if enabled:
+                getattr(self, part).grid(**_PART_GRID_OPTS[part])
+                self._mapped_parts.add(part)
+
+    def _schedule_layout(self, part: str, visible: bool) -> None:
+        # Record the wanted visibility of PART and lay out every
+        # pending part in one pass once Tk is idle
+        self._pending_layout[part] = visible
+        if self._layout_after_id is None:
+            self._layout_after_id = self.after_idle(self._flush_layout)
+
+    def _flush_layout(self) -> None:
+        self._layout_after_id = None
+        pending, self._pending_layout = self._pending_layout, {}
+        mapped = self._mapped_parts
+
+        for part, visible in pending.items():
+            if visible == (part in mapped):
+                continue
+
+            widget = getattr(self, part)
+            if visible:
+                widget.grid(**_PART_GRID_OPTS[part])
+                mapped.add(part)
+            else:
+                widget.grid_forget()
+                mapped.discard(part)
+
+    def destroy(self) -> None:
+        """Destroy this widget."""
+        if self._layout_after_id is not None:
+            self.after_cancel(self._layout_after_id)
+            self._layout_after_id = None
+
+        super().destroy()
+
+    @property
+    def label(self) -> ttk.Label:
+        """Label that displays the contents of the label option."""
+        label = self._label
+        if label is None:
+            label = self._label = ttk.Label(self.frame)
+        return label
+
+    @property
+    def xbar(self) -> ttk.Scrollbar:
+        """Horizontal scrollbar."""
+        xbar = self._xbar
+        if xbar is None:
+            xbar = self._xbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL,
+                                              command=self.xview)
+
+            # Bind the X scroll command to the scrollbar
+            super().configure(xscrollcommand=xbar.set)
+
+        return xbar
+
+    @property
+    def clearbutton(self) -> ttk.Button:
+        """Button that clears the text."""
+        clearbutton = self._clearbutton
+        if clearbutton is None:
+            clearbutton = self._clearbutton = ttk.Button(self.frame, text="X",
+                                                         command=self.clear, width=2)
+            enabled = self._clearbutton_state = bool(self.get())
+            clearbutton.state(("!disabled",) if enabled else ("disabled",))
+
+        return clearbutton
 
     def clear(self) -> None:
         """Clear the entry."""
+        # Validation emits on_text_changed
         self.delete(0, tk.END)
-        self.on_text_changed.emit("")
 
     def configure(self, *, scrollx: bool | None=None,
                   clearbutton: bool | None=None,
                   label: str | None=None, **kw: Any):
         if scrollx is not None:
-            self.set_custom_resource('scrollx', scrollx)
-            self.on_x_scrollbar_changed.emit(scrollx)
+            if self.update_custom_resource('scrollx', scrollx):
+                self.on_x_scrollbar_changed.emit(scrollx)
 
         if clearbutton is not None:
-            self.set_custom_resource('clearbutton', clearbutton)
-            self.on_clearbutton_changed.emit(clearbutton)
+            if self.update_custom_resource('clearbutton', clearbutton):
+                self.on_clearbutton_changed.emit(clearbutton)
 
         if label is not None:
-            self.set_custom_resource('label', label)
-            self.on_label_changed.emit(label)
+            if self.update_custom_resource('label', label):
+                self.on_label_changed.emit(label)
 
         super().configure(kw)
 
@@ -110,17 +227,17 @@ class ExEntry(ttk.Entry, _WidgetMixin):
                               label=label, **kw)
 
     def cget(self, key: str) -> Any:
-        if self.resource_defined(key):
+        if key in self._CUSTOM_KEYS:
             return self.get_custom_resource(key)
 
         return super().cget(key)
 
-    def __validate_entry(self,
+    def _validate_entry(self,
                          reason: Literal['focusin', 'focusout', 'key', 'forced'],
-                         new_text: str) -> bool:
+                         old_text: str, new_text: str) -> bool:
         # Entry validation
-        if reason.startswith('focus'):
-            # Skip focus(in/out) events
+        if reason in _FOCUS_REASONS or new_text == old_text:
+            # Skip focus(in/out) events and edits that leave the text as is
             return True
 
         # Insertions or deletions warrent this signal
@@ -132,49 +249,31 @@ class ExEntry(ttk.Entry, _WidgetMixin):
     #
 
     def _on_label_changed(self, obj: object, new_text: str, **kw):
-        label = self.label
         if new_text:
             # There is text to display
+            self.label.configure(text=new_text)
 
-            if not label.winfo_ismapped():
-                # Map the label
-                self.label.grid(row=0, column=0)
-
-            # Configure the label
-            label.configure(text=new_text)
-
-            return
-
-        # No text, unmap the label if it is visible
-        if label.winfo_ismapped():
-            label.grid_forget()
+        # Show the label only if there is text
+        self._schedule_layout('label', bool(new_text))
 
     def _on_x_scrollbar_changed(self, obj: object, state: bool, **kw):
-        if state:
-            if not self.xbar.winfo_ismapped():
-                # Map the scrollbar if it isn't already
-                self.xbar.grid(row=1, column=1, sticky='ew')
-                return
-
-        if self.xbar.winfo_ismapped():
-            # The scrollbar is visible, so unmap it
-            self.xbar.grid_forget()
+        self._schedule_layout('xbar', state)
 
     def _on_clearbutton_changed(self, obj: object, state: bool, **kw):
-        clearbutton = self.clearbutton
+        self._schedule_layout('clearbutton', state)
 
-        # If enabled, map the button if not already
-        if state and not clearbutton.winfo_ismapped():
-            clearbutton.grid(row=0, column=2)
+    def _on_text_changed(self, obj: object, new_text: str, **kw):
+        # The button gets the right state when it is created
+        clearbutton = self._clearbutton
+        if clearbutton is None:
             return
 
-        # If disabled, unmap the button if it is visible
-        if not state and clearbutton.winfo_ismapped():
-            clearbutton.grid_forget()
-
-    def _on_text_changed(self, obj: object, new_text: str, **kw):
         # Enable the 'clear' button if there's text, otherwise disable it
-        new_state = ("!disabled",) if new_text else ("disabled",)
-        self.clearbutton.state(new_state)
+        enabled = bool(new_text)
+        if enabled == self._clearbutton_state:
+            return
+
+        self._clearbutton_state = enabled
+        clearbutton.state(("!disabled",) if enabled else ("disabled",))
 
 # ExEntry.override_init_docstring(ttk.Entry)
@@ -1,21 +1,46 @@
 from __future__ import annotations
 from tkinter import ttk
-from . import _WidgetMixin
+from . import _WidgetMixin, _LazySignal
 from ..signals import signal
+from ..utils import binary_search
 from typing import TYPE_CHECKING
 import tkinter as tk, sys
 
 if TYPE_CHECKING:
-    from typing import Any, Sequence, TypeVar, Callable
-    from .utils import _Widget, SupportsRichComparisons, binary_search
+    from typing import Any, Iterable, Sequence, TypeVar, Callable
+    from .utils import _Widget, SupportsRichComparisons
 
     T = TypeVar("T")
 
     _KeyFunction = Callable[[T], SupportsRichComparisons]
 
+# Tk constants used by the widget
+_RIGHT, _Y, _BOTH, _END = tk.RIGHT, tk.Y, tk.BOTH, tk.END
+
+# Number of items set_values inserts at a time
+_INSERT_CHUNK_SIZE = 1000
+
 class ExListbox(tk.Listbox, _WidgetMixin):
     """Extended entry widget."""
 
+    # Options handled by the widget instead of Tk
+    _CUSTOM_KEYS = frozenset({'scrolly'})
+
+    # Signals that are only created once they are used
+    #
+
+    #: | ``on_item_selected(item: str | float)``
+    #: Emitted when a single item is selected.
+    on_item_selected = _LazySignal('item_selected')
+
+    #: | ``on_items_selected(items: Sequence[str | float])``
+    #: Emitted when multiple items are selected.
+    on_items_selected = _LazySignal('items_selected')
+
+    #: | ``on_values_set(values: Sequence[str | float])``
+    #: Emitted when values are set via :py:meth:`set_values`.
+    on_values_set = _LazySignal('values_set')
+
     def __init__(self, master: _Widget=None, *, scrolly: bool=False, **kw: Any):
         """
         Construct an extended listbox widget with the parent `master`.
@@ -27,19 +52,7 @@ class ExListbox(tk.Listbox, _WidgetMixin):
         :keyword **kw: Arguments forwarded to :py:class:`tkinter.Listbox`
         """
         # Signals
-        #: | ``on_item_selected(item: str | float)``
-        #: Emitted when a single item is selected.
-        self.on_item_selected = signal('item_selected', self)
-
-        #: | ``on_items_selected(items: Sequence[str | float])``
-        #: Emitted when multiple items are selected.
-        self.on_items_selected = signal('items_selected', self)
-
-        #: | ``on_values_set(values: Sequence[str | float])``
-        #: Emitted when values are set via :py:meth:`set_values`.
-        self.on_values_set = signal('values_set', self)
-
-        #: | ``on_values_set(enabled: bool)``
+        #: | ``on_y_scrollbar_changed(enabled: bool)``
         #: Emitted when the state of the vertical scrollbar is changed.
         #: `enabled` indicates whether the scrollbar is visible and can be used.
         self.on_y_scrollbar_changed = signal('y_scrollbar_changed', self)
@@ -53,19 +66,19 @@ class ExListbox(tk.Listbox, _WidgetMixin):
 
         kw['yscrollcommand'] = self.ybar.set
 
+        # Whether the scrollbar is packed
+        self._ybar_mapped = False
+
         super().__init__(self.frame, **kw)
 
         self.set_custom_resources(scrolly=scrolly)
 
-        self.pack(fill=tk.BOTH)
-
-        # Emit signals
-        self.on_item_selected.emit("")
-        self.on_items_selected.emit(["", ""])
-        self.on_values_set.emit([])
-        self.on_y_scrollbar_changed.emit(scrolly)
+        super().pack(fill=_BOTH)
 
-        self.override_geomtry_methods(tk.Listbox)
+        # Nothing can be connected to the signals yet, so map the
+        # scrollbar directly instead of emitting
+        if scrolly:
+            self._on_y_scrollbar_changed(self, scrolly)
 
         # Bindings
         def _listbox_selected(event: tk.Event): # pyright: ignore
@@ -81,28 +94,26 @@ class ExListbox(tk.Listbox, _WidgetMixin):
 
     def configure(self, scrolly: bool | None=None, **kw: Any):
         if scrolly is not None:
-            self.set_custom_resource('scrolly', scrolly)
-            self.on_y_scrollbar_changed.emit(scrolly)
+            if self.update_custom_resource('scrolly', scrolly):
+                self.on_y_scrollbar_changed.emit(scrolly)
         super().configure(kw)
 
     def cget(self, key: str) -> Any:
-        if self.resource_defined(key):
+        if key in self._CUSTOM_KEYS:
             return self.get_custom_resource(key)
         return super().cget(key)
 
     @property
     def size(self) -> int:
         """Number of items."""
-        l = self.get(0, tk.END)
-        assert isinstance(l, (list, tuple))
-        return len(l)
+        return self.index(_END)
 
     # Methods that manipulate/query entries
     #
 
     def clear(self) -> None:
         """Clear the listbox of all entries."""
-        self.delete(0, tk.END)
+        self.delete(0, _END)
 
     def curselection(self) -> Sequence[int]:
         """
@@ -117,33 +128,30 @@ class ExListbox(tk.Listbox, _WidgetMixin):
 
         return sel
 
-    def search(self, pattern: str, /) -> int:
+    def search(self, pattern: str, /, *, sorted: bool=False) -> int:
         """
         Search the listbox for an item matching a pattern.
 
         :param str pattern: the used to match against the
                             listbox items
 
+        :keyword bool sorted: if true, the items are assumed to be
+                              sorted, which allows a binary search
+                              on larger listboxes
+
         :return: the index of the first match on success,
                  or -1 on failure
         :rtype: int
         """
-        values = list(self.get(0, tk.END))
+        values = self.get(0, _END)
 
-        if len(values) >= 15:
+        if sorted and len(values) >= 15:
             return binary_search(values, pattern)
 
-        res = -1
-        i = 0
-
-        for val in values:
-            if val == pattern:
-                res = i
-                break
-
-            i += 1
-
-        return res
+        try:
+            return values.index(pattern)
+        except ValueError:
+            return -1
 
     def select(self, first: str | int, see: bool=True) -> None:
         """
@@ -161,15 +169,33 @@ class ExListbox(tk.Listbox, _WidgetMixin):
         if see:
             self.see(first)
 
-    def set_values(self, values: Sequence[str | float], /) -> None:
+    def set_values(self, values: Iterable[str | float], /) -> None:
         """
         Replace the items in the listbox.
 
-        :param values: the new list of values
+        :param values: the new values; any iterable is accepted
+
+        Values are inserted in chunks of 1000. For longer lists,
+        pending idle tasks (including redraws) are processed
+        between chunks, so the listbox is redrawn partway through
+        the call. Shorter lists are not redrawn until Tk is idle;
+        call :py:meth:`update_idletasks` to update them right away.
         """
-        self.clear()
-        self.insert(tk.END, *values)
-        self.update()
+        # Chunking below needs len() and slicing
+        if not isinstance(values, (list, tuple)):
+            values = tuple(values)
+
+        tk_call = self.tk.call
+        w = self._w
+        tk_call(w, 'delete', 0, 'end')
+
+        # Insert large lists in chunks so the display is updated
+        # between them
+        for i in range(0, len(values), _INSERT_CHUNK_SIZE):
+            if i:
+                self.update_idletasks()
+            tk_call(w, 'insert', 'end', *values[i:i+_INSERT_CHUNK_SIZE])
+
         self.on_values_set.emit(values)
 
     def sort(self, *, key: _KeyFunction | None=None, reverse=False) -> None:
@@ -183,23 +209,26 @@ class ExListbox(tk.Listbox, _WidgetMixin):
 
         :keyword bool reverse: if true, sort in reverse order
         """
-        values = list(self.get(0, tk.END))
-        assert isinstance(values, list)
+        values = sorted(self.get(0, _END), key=key, reverse=reverse)
 
         if len(values) > 1:
-            self.set_values(sorted(values, key=key, reverse=reverse))
+            self.delete(0, _END)
+            self.insert(_END, *values)
+            self.on_values_set.emit(values)
 
     # Signal handlers
     #
 
     def _on_y_scrollbar_changed(self, obj: object, enabled: bool, **kw) -> None:
         if enabled:
-            if not self.ybar.winfo_ismapped():
+            if not self._ybar_mapped:
                 # Map the scrollbar if it isn't already
-                self.ybar.pack(side=tk.RIGHT, fill=tk.Y, before=self)
+                self.ybar.pack(side=_RIGHT, fill=_Y, before=self)
+                self._ybar_mapped = True
 
             return
 
-        if self.ybar.winfo_ismapped():
+        if self._ybar_mapped:
             # Disabled; the scrollbar is visible, so unmap it
             self.ybar.pack_forget()
+            self._ybar_mapped = False
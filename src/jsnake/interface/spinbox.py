@@ -1,6 +1,6 @@
 from __future__ import annotations
 from tkinter import ttk, constants as tkconst
-from .utils import _WidgetMixin
+from . import _WidgetMixin
 from ..signals import signal, InvalidSignalError
 from typing import TYPE_CHECKING
 import tkinter as tk, sys
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 class ExSpinbox(ttk.Spinbox, _WidgetMixin):
     """Extended entry widget."""
 
+    # Options handled by the widget instead of Tk
+    _CUSTOM_KEYS = frozenset({'text'})
+
     def __init__(self, master: _Widget=None, *, text: str | None=None, **kw: Any):
         """
         EXTRA OPTIONS
@@ -26,10 +29,14 @@ class ExSpinbox(ttk.Spinbox, _WidgetMixin):
                 the new string for the label.
         """
         self.on_text_changed = signal('text_changed', self)
-        self.on_text_changed.connect(self)
+        self.on_text_changed.connect(self._on_text_changed)
+
+        # Handlers used by on_notify, by signal name
+        self._notify_handlers = {'text_changed': self._on_text_changed}
 
         self.frame = ttk.Frame(master, padding='0 0 0 16')
         self.label = ttk.Label(self.frame, text=text or "")
+        self._label_mapped = False
 
         super().__init__(self.frame, **kw)
 
@@ -39,19 +46,17 @@ class ExSpinbox(ttk.Spinbox, _WidgetMixin):
         self.set_custom_resources(text=text)
         self.on_text_changed.emit(text or "")
 
-        self.pack()
-
-        self.override_geomtry_methods(ttk.Entry)
+        super().pack()
 
     def configure(self, *, text: str | None=None, **kw: Any):
         if text is not None:
-            self.set_custom_resource('text', text)
-            self.on_text_changed.emit(text)
+            if self.update_custom_resource('text', text):
+                self.on_text_changed.emit(text)
 
         super().configure(kw)
 
     def cget(self, key: str) -> Any:
-        if self.resource_defined(key):
+        if key in self._CUSTOM_KEYS:
             return self.get_custom_resource(key)
 
         return super().cget(key)
@@ -64,22 +69,28 @@ class ExSpinbox(ttk.Spinbox, _WidgetMixin):
         return float(super().get())
 
     def on_notify(self, sig: str, obj=None, *args: Any, **kw: Any) -> None: # pyright: ignore
-        match sig:
-            case 'text_changed':
-                text: str = args[0]
-                label = self.label
-                if text:
-                    kw = {}
-                    if not label.winfo_ismapped():
-                        if self.frame.winfo_ismapped():
-                            kw['before'] = self.entry_name
-                        label.pack(**kw)
-                    label.configure(text=text)
-                else:
-                    if label.winfo_ismapped():
-                        label.pack_forget()
-
-            case _:
-                raise InvalidSignalError(sig)
-
-ExSpinbox.override_init_docstring(ttk.Spinbox)
+        handler = self._notify_handlers.get(sig)
+        if handler is None:
+            raise InvalidSignalError(sig)
+
+        handler(obj, *args, **kw)
+
+    ## Signals
+    #
+
+    def _on_text_changed(self, obj: object, text: str, **kw: Any) -> None:
+        label = self.label
+        if text:
+            opts = {}
+            if not self._label_mapped:
+                if self.frame.winfo_ismapped():
+                    opts['before'] = self.entry_name
+                label.pack(**opts)
+                self._label_mapped = True
+            label.configure(text=text)
+        else:
+            if self._label_mapped:
+                label.pack_forget()
+                self._label_mapped = False
+
+# ExSpinbox.override_init_docstring(ttk.Spinbox)
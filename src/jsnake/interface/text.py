@@ -8,16 +8,39 @@ import tkinter as tk, re
 if TYPE_CHECKING:
     from typing import Literal, Optional
 
+# Tk constants used by the widget
+_BOTTOM, _RIGHT, _X, _Y, _BOTH = tk.BOTTOM, tk.RIGHT, tk.X, tk.Y, tk.BOTH
+
+_HEX_COLOR_RE = re.compile(r'#[0-9a-f]{6}\Z')
+
+# Custom options handled by configure(): the option name, its type
+# and the name used in errors, the signal to emit, whether the value
+# is a color, and the arguments passed to the signal before the value
+_CONFIG_SPEC: tuple[tuple[str, type, str, str, bool, tuple[str, ...]], ...] = (
+    ('scrollx', bool, "boolean", 'on_x_scrollbar_changed', False, ()),
+    ('scrolly', bool, "boolean", 'on_y_scrollbar_changed', False, ()),
+    ('normalbackground', str, "string", 'on_background_changed', True, ("normal",)),
+    ('disabledbackground', str, "string", 'on_background_changed', True, ("disabled",))
+)
+
 class ExText(tk.Text, _WidgetMixin, _StateMethods):
     """Extended text widget."""
 
+    # Options handled by the widget instead of Tk
+    _CUSTOM_KEYS = frozenset({'scrollx', 'scrolly', 'normalbackground', 'disabledbackground'})
+
     def _tk_color_name_to_number(self, color: str, /) -> str:
-        if re.match(r'#[0-9a-f]{6}', color):
+        if _HEX_COLOR_RE.match(color):
             return color
 
-        r, g, b = self.winfo_rgb(color)
-        icolor = ((r & 0xff00) << 8) | (g & 0xff00) | (b >> 8)
-        return f"#{icolor:06x}"
+        # Color names are resolved by Tk, so cache the results
+        cache = self._rgb_cache
+        hexcolor = cache.get(color)
+        if hexcolor is None:
+            r, g, b = self.winfo_rgb(color)
+            hexcolor = cache[color] = f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
+
+        return hexcolor
 
     def __init__(self, master=None, *,
                  scrollx=False, scrolly=False,
@@ -30,6 +53,9 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
         self.on_background_changed = signal('background_changed', self)
         self.on_state_changed = signal('state_changed', self)
 
+        # Color names already converted by _tk_color_name_to_number
+        self._rgb_cache: dict[str, str] = {}
+
         self.frame = ttk.Frame(master)
 
         self.xbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL,
@@ -38,18 +64,21 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
         self.ybar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL,
             command=self.yview)
 
+        # Scrollbars that are currently packed
+        self._mapped_scrollbars: set[ttk.Scrollbar] = set()
+
         # Connect signals
         self.on_x_scrollbar_changed.connect(
             self._on_scrollbar_changed,
             scrollbar=self.xbar,
-            side=tk.BOTTOM,
-            fill=tk.X
+            side=_BOTTOM,
+            fill=_X
         )
         self.on_y_scrollbar_changed.connect(
             self._on_scrollbar_changed,
             scrollbar=self.ybar,
-            side=tk.RIGHT,
-            fill=tk.Y,
+            side=_RIGHT,
+            fill=_Y,
             before=self
         )
         self.on_background_changed.connect(self._on_background_changed)
@@ -74,9 +103,7 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
             disabledbackground=disabledbackground
         )
 
-        self.pack(fill=tk.BOTH)
-
-        self.override_geomtry_methods(tk.Text)
+        super().pack(fill=_BOTH)
 
         # Emit signals
         self.on_x_scrollbar_changed.emit(scrollx)
@@ -87,41 +114,19 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
                                         self.get_custom_resource('disabledbackground'))
 
     def configure(self, **kw):
-        missing = object()
-
-        # scrollx
-        scrollx: bool | object = kw.pop('scrollx', missing)
-        if scrollx is not missing:
-            if not isinstance(scrollx, bool):
-                raise TypeError("-scrollx must be a boolean")
-            self.set_custom_resource('scrollx', scrollx)
-            self.on_x_scrollbar_changed.emit(scrollx)
-
-        # scrolly
-        scrolly: bool | object = kw.pop('scrolly', missing)
-        if scrolly is not missing:
-            if not isinstance(scrolly, bool):
-                raise TypeError("-scrolly must be a boolean")
-            self.set_custom_resource('scrolly', scrolly)
-            self.on_y_scrollbar_changed.emit(scrolly)
-
-        # normal background
-        normalbackground: str | object = kw.pop('normalbackground', missing)
-        if normalbackground is not missing:
-            if not isinstance(normalbackground, str):
-                raise TypeError("-normalbackground must be a string")
-            color = self._tk_color_name_to_number(normalbackground)
-            self.set_custom_resource('normalbackground', color)
-            self.on_background_changed.emit("normal", color)
-
-        # disabled background
-        disabledbackground: str | object = kw.pop('disabledbackground', missing)
-        if disabledbackground is not missing:
-            if not isinstance(disabledbackground, str):
-                raise TypeError("-disabledbackground must be a string")
-            color = self._tk_color_name_to_number(disabledbackground)
-            self.set_custom_resource('disabledbackground', color)
-            self.on_background_changed.emit("disabled", color)
+        for name, typ, typename, sig, is_color, sig_args in _CONFIG_SPEC:
+            if name not in kw:
+                continue
+
+            value = kw.pop(name)
+            if not isinstance(value, typ):
+                raise TypeError(f"-{name} must be a {typename}")
+
+            if is_color:
+                value = self._tk_color_name_to_number(value)
+
+            if self.update_custom_resource(name, value):
+                getattr(self, sig).emit(*sig_args, value)
 
         super().configure(**kw)
 
@@ -129,7 +134,7 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
             self.on_state_changed.emit(kw['state'])
 
     def cget(self, key: str, /):
-        if self.resource_defined(key):
+        if key in self._CUSTOM_KEYS:
             return self.get_custom_resource(key)
 
         return super().cget(key)
@@ -144,15 +149,19 @@ class ExText(tk.Text, _WidgetMixin, _StateMethods):
         side: Literal['left', 'right', 'top', 'bottom'] = kw.pop('side')
         fill: Literal['none', 'x', 'y', 'both'] = kw.pop('fill')
 
+        mapped = self._mapped_scrollbars
+
         if enabled:
-            if not sbar.winfo_ismapped():
+            if sbar not in mapped:
                 # Map the scrollbar if it isn't already
                 sbar.pack(side=side, fill=fill, **kw)
-                return
+                mapped.add(sbar)
+            return
 
-        if sbar.winfo_ismapped():
+        if sbar in mapped:
             # Disabled; the scrollbar is visible, so unmap it
             sbar.pack_forget()
+            mapped.discard(sbar)
 
     def _on_background_changed(self, obj: object, bgstate: str, color: str, **kw) -> None:
         if bgstate == self.state():
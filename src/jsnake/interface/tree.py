@@ -1,6 +1,7 @@
 from __future__ import annotations
 from tkinter import ttk, constants as tkconst
-from .utils import _WidgetMixin, _Column
+from . import _WidgetMixin
+from .types import _Column
 from ..logging import get_logger
 from ..signals import signal, InvalidSignalError
 from typing import TYPE_CHECKING, cast
@@ -30,6 +31,9 @@ class ExTree(ttk.Treeview, _WidgetMixin):
               column (#0 being the tree column); the row; and the element, are provided.
     """
 
+    # Options handled by the widget instead of Tk
+    _CUSTOM_KEYS = frozenset({'scrollx', 'scrolly'})
+
     def __init__(self, master: _Widget=None,
                  scrolly: bool=False, scrollx: bool=False,
                  columns: list[_Column] | None=None,
@@ -47,13 +51,19 @@ class ExTree(ttk.Treeview, _WidgetMixin):
 
         # Signals
         self.on_x_scrollbar_changed = signal('x_scrollbar_changed', self)
-        self.on_x_scrollbar_changed.connect(self)
+        self.on_x_scrollbar_changed.connect(self._on_x_scrollbar_changed)
 
         self.on_y_scrollbar_changed = signal('y_scrollbar_changed', self)
-        self.on_y_scrollbar_changed.connect(self)
+        self.on_y_scrollbar_changed.connect(self._on_y_scrollbar_changed)
 
         self.on_item_doubleclicked = signal('item_doubleclicked', self)
-        self.on_item_doubleclicked.connect(self)
+
+        # Handlers used by on_notify, by signal name
+        self._notify_handlers = {
+            'x_scrollbar_changed': self._on_x_scrollbar_changed,
+            'y_scrollbar_changed': self._on_y_scrollbar_changed,
+            'item_doubleclicked': self._on_item_doubleclicked
+        }
 
         self.frame = ttk.Frame(master)
         self.xbar = ttk.Scrollbar(self.frame, orient=tkconst.HORIZONTAL, command=self.xview)
@@ -87,9 +97,7 @@ class ExTree(ttk.Treeview, _WidgetMixin):
         self.on_y_scrollbar_changed.emit(scrolly)
 
         # Render the tree widget
-        self.pack()
-
-        self.override_geomtry_methods(ttk.Treeview)
+        super().pack()
 
         self.bind('<Double-1>', self._eventcb_doubleclicked)
 
@@ -119,7 +127,7 @@ class ExTree(ttk.Treeview, _WidgetMixin):
         self.delete(*children)
 
     def cget(self, key: str) -> Any:
-        if self.resource_defined(key):
+        if key in self._CUSTOM_KEYS:
             return self.get_custom_resource(key)
 
         return super().cget(key)
@@ -127,35 +135,38 @@ class ExTree(ttk.Treeview, _WidgetMixin):
     def configure(self, *, scrolly: bool | None=None,
                   scrollx: bool | None=None, **kw: Any):
         if scrollx is not None:
-            self.set_custom_resource('scrollx', scrollx)
-            self.on_x_scrollbar_changed.emit(scrollx)
+            if self.update_custom_resource('scrollx', scrollx):
+                self.on_x_scrollbar_changed.emit(scrollx)
 
         if scrolly is not None:
-            self.set_custom_resource('scrolly', scrolly)
-            self.on_y_scrollbar_changed.emit(scrolly)
+            if self.update_custom_resource('scrolly', scrolly):
+                self.on_y_scrollbar_changed.emit(scrolly)
 
         super().configure(kw)
 
     def on_notify(self, sig: str, obj: Any, *args: Any, **kw: Any) -> None: # pyright: ignore
-        match sig:
-            case 'x_scrollbar_changed':
-                state: bool = args[0]
-                if state:
-                    self.xbar.pack(side=tkconst.BOTTOM, fill=tkconst.X)
-                else:
-                    self.xbar.pack_forget()
-
-            case 'y_scrollbar_changed':
-                state: bool = args[0]
-                if state:
-                    self.ybar.pack(side=tkconst.RIGHT, fill=tkconst.Y)
-                else:
-                    self.ybar.pack_forget()
-
-            case 'item_doubleclicked':
-                pass
-
-            case _: # pragma: no cover
-                raise InvalidSignalError(sig)
-
-ExTree.override_init_docstring(ttk.Treeview)
+        handler = self._notify_handlers.get(sig)
+        if handler is None: # pragma: no cover
+            raise InvalidSignalError(sig)
+
+        handler(obj, *args, **kw)
+
+    ## Signals
+    #
+
+    def _on_x_scrollbar_changed(self, obj: object, state: bool, **kw: Any) -> None:
+        if state:
+            self.xbar.pack(side=tkconst.BOTTOM, fill=tkconst.X)
+        else:
+            self.xbar.pack_forget()
+
+    def _on_y_scrollbar_changed(self, obj: object, state: bool, **kw: Any) -> None:
+        if state:
+            self.ybar.pack(side=tkconst.RIGHT, fill=tkconst.Y)
+        else:
+            self.ybar.pack_forget()
+
+    def _on_item_doubleclicked(self, obj: object, *args: Any, **kw: Any) -> None:
+        pass
+
+# ExTree.override_init_docstring(ttk.Treeview)
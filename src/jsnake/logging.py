@@ -37,7 +37,14 @@ class Level(IntEnum):
         :return: The logging level object corresponding to `key`
         :rtype: Level or None
         """
-        return cls.__members__.get(key)
+        return _LEVEL_BY_NAME.get(key)
+
+# Lookup tables for Level
+_LEVEL_BY_NAME: dict[str, Level] = {m.name: m for m in Level}
+_LEVEL_BY_INT: dict[int, Level] = {m.value: m for m in Level}
+
+# Levels already computed by _get_default_level, by variable name
+_level_cache: dict[str, Level] = {}
 
 def _get_default_level(envname: str) -> Level:
     """
@@ -46,29 +53,53 @@ def _get_default_level(envname: str) -> Level:
     If ENVNAME is undefined or its value is invalid,
     `Level.INFO` is returned.
     """
+    cached = _level_cache.get(envname)
+    if cached is not None:
+        return cached
+
+    result = Level.INFO
     level = get_env(envname)
     if level is not None:
         try:
-            ilevel = int(level)
-            return Level(ilevel)
-        except:
-            pass
+            result = _LEVEL_BY_INT.get(int(level), Level.INFO)
+        except ValueError:
+            result = _LEVEL_BY_NAME.get(level, Level.INFO)
 
-        if level in ('DEBUG', 'INFO', 'WARN', 'ERROR', 'CRITICAL'):
-            level = Level.find_by_keyword(level)
-            if level is not None:
-                assert isinstance(level, Level)
-                return level
-
-    return Level.INFO
+    _level_cache[envname] = result
+    return result
 
 DEFAULT_LEVEL = Level.INFO
 Logger = logging.Logger
 
 _rootLogger: Logger
+_FORMATTER = logging.Formatter("%(levelname)s %(name)s: [%(asctime)s] %(message)s")
 _cache: dict[str, Logger] = {}
 _initialized = False
 
+# Handler constructors used by add_handler
+#
+
+def _make_stream_handler(logger: Logger, kw: dict) -> logging.Handler:
+    hdl = logging.StreamHandler(kw.get('stream'))
+    hdl.setFormatter(_FORMATTER)
+    return hdl
+
+def _make_file_handler(logger: Logger, kw: dict) -> logging.Handler:
+    # The file is not opened until the first record is emitted
+    hdl = logging.FileHandler(kw['file'], kw.get('mode', 'wt'), kw.get('encoding'),
+                              delay=True)
+    hdl.setFormatter(_FORMATTER)
+    return hdl
+
+def _make_null_handler(logger: Logger, kw: dict) -> logging.Handler:
+    return logging.NullHandler(logger.level)
+
+_HANDLER_BUILDERS = {
+    'stream': _make_stream_handler,
+    'file': _make_file_handler,
+    'null': _make_null_handler
+}
+
 def add_handler(logger: Logger, kind: str, **kw):
     """
     Add the specified type of handler to a logger.
@@ -103,23 +134,11 @@ def add_handler(logger: Logger, kind: str, **kw):
     * null
         * No arguments.
     """
-    hdl = None
-    formatter = logging.Formatter(f"%(levelname)s %(name)s: [%(asctime)s] %(message)s")
-
-    if kind == 'stream':
-        hdl = logging.StreamHandler(kw.get('stream'))
-        hdl.setFormatter(formatter)
-    elif kind == 'file':
-        filehdl_args: tuple[str, str | None] = (kw.get('mode', 'wt'), kw.get('encoding'))
-        hdl = logging.FileHandler(kw['file'], *filehdl_args)
-        hdl.setFormatter(formatter)
-    elif kind == 'null':
-        hdl = logging.NullHandler(logger.level)
-
-    if hdl is None:
+    builder = _HANDLER_BUILDERS.get(kind)
+    if builder is None:
         raise LoggingError(f"Invalid handler type '{kind}'.")
 
-    logger.addHandler(hdl)
+    logger.addHandler(builder(logger, kw))
 
 def get_logger(name="", level=None, stream=True):
     """
@@ -164,25 +183,14 @@ def get_logger(name="", level=None, stream=True):
     """
     global _cache
 
-    # Return the root logger if name is "" or "yt_dlp_tk"
-    parts = name.split(".")
-    isroot = parts[0] == "" and len(parts) == 1
-    if isroot:
+    # Return the root logger if name is ""
+    if not name:
         return _rootLogger
 
-    # Insert root name into the array
-    # root_name = _rootLogger.name
-    # if parts[0] not in ("", root_name):
-    #     parts.insert(0, root_name)
-    # if parts[0] == "":
-    #     parts[0] = root_name
-
-    # Join list into a string
-    # name = ".".join(parts)
-
     # Return the cached logger
-    if name in _cache:
-        return _cache[name]
+    logger = _cache.get(name)
+    if logger is not None:
+        return logger
 
     # Default logger
     if level is None:
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 from typing import Protocol, Any, cast
+import sys
+
+class InvalidSignalError(Exception):
+    """An object was notified of a signal it does not handle."""
 
 class _signal_function(Protocol):
     def __call__(self, obj: object, *args: Any, **kw: Any) -> None:
@@ -10,7 +14,7 @@ class _signal_function(Protocol):
 class signal:
     """Implements the observer pattern."""
 
-    __slots__ = ('name', '_observers', 'obj')
+    __slots__ = ('name', '_fns', '_args', '_kws', '_nbound', 'obj')
 
     def __init__(self, name, obj=None):
         """
@@ -23,37 +27,44 @@ class signal:
                            the caller's ``self`` is used, or
                            its module if ``self`` is unavailable
         """
-        self.name: str = name #: Name of the signal
-        self._observers = []
-        self.obj = obj #: Object bound to the signal
-
         if obj is None:
-            import inspect, sys
+            # Use the 'self' argument of the function calling this
+            # one if present, or its module otherwise
+            try:
+                frame = sys._getframe(1)
+            except ValueError: # pragma: no cover
+                pass
+            else:
+                obj = frame.f_locals.get('self')
+                if obj is None:
+                    obj = sys.modules[frame.f_globals['__name__']]
 
-            # Get current frame
-            frame = inspect.currentframe()
-            if frame is None: return
+        self.name: str = name #: Name of the signal
+        self.obj = obj #: Object bound to the signal
 
-            # Go up one level, to the function calling this one
-            frame = frame.f_back
-            if frame is None: return
+        # Connected functions and their bound arguments,
+        # stored in parallel lists
+        self._fns = []
+        self._args = []
+        self._kws = []
 
-            # Get the 'self' argument if present
-            _locals = frame.f_locals
-            obj = _locals.get('self')
-            if obj is None:
-                # Not present, use the module instead
-                obj = sys.modules[frame.f_globals['__name__']]
+        # Number of connections with binds; emit takes a
+        # faster path when there are none
+        self._nbound = 0
 
-            self.obj = obj
+    def _find_bind(self, fn, args, kw) -> int:
+        # Return the index of the matching bind or -1
+        _args, _kws = self._args, self._kws
+        for i, other in enumerate(self._fns):
+            if other == fn and _args[i] == args and _kws[i] == kw:
+                return i
 
-    def _form_signal_bind(self, fn, *args, **kw):
-        return fn, args, kw
+        return -1
 
     @property
     def count(self):
         """Number of registered functions."""
-        return len(self._observers)
+        return len(self._fns)
 
     def connect(self, func, *binds, **kw):
         """
@@ -89,12 +100,55 @@ class signal:
         if not callable(func):
             raise TypeError("First argument must be a function")
 
-        bind = self._form_signal_bind(func, *binds, **kw)
-        if bind in self._observers:
+        if self._find_bind(func, binds, kw) >= 0:
             # Error if duplicate binds
             raise ValueError("Already connected this signal to this function with the specified binds")
 
-        self._observers.append(bind)
+        self._append(func, binds, kw)
+
+    def _append(self, func, binds: tuple, kw: dict) -> None:
+        # Register a validated connection
+        self._fns.append(func)
+        self._args.append(binds)
+        self._kws.append(kw)
+        if binds or kw:
+            self._nbound += 1
+
+    def connect_many(self, items):
+        """
+        Connect the signal to several functions at once.
+
+        :param items: Tuples of a function, the positional
+                      arguments bound to it, and the keyword
+                      arguments bound to it
+        :type items: Iterable[tuple[function, tuple, dict]]
+
+        :raises TypeError: if a function is not callable
+        :raises ValueError: if a function is already connected
+                            with the same binds
+
+        Each item is connected as if by :py:meth:`connect`. The
+        whole batch is checked first, so if any item is invalid,
+        none of them are connected.
+        """
+        find_bind = self._find_bind
+
+        # Validate everything before connecting anything
+        batch = []
+        for func, binds, kw in items:
+            binds, kw = tuple(binds), dict(kw)
+            if not callable(func):
+                raise TypeError("First argument must be a function")
+
+            item = (func, binds, kw)
+            if find_bind(func, binds, kw) >= 0 or item in batch:
+                # Error if duplicate binds
+                raise ValueError("Already connected this signal to this function with the specified binds")
+
+            batch.append(item)
+
+        for func, binds, kw in batch:
+            self._append(func, binds, kw)
 
     def disconnect(self, func, *binds, **kw):
         """
@@ -110,21 +164,13 @@ class signal:
         .. note::
            Arguments must be the same as the ones passed to :py:func:`connect`.
         """
-        bind = self._form_signal_bind(func, *binds, **kw)
-        self._observers.remove(bind)
-
-    @staticmethod
-    def _is_signal_bind(arg) -> bool:
-        def _is_str_any_dict(arg):
-            return map(lambda x: isinstance(x, str), arg.keys())
-
-        match arg:
-            case (fn, args, kw):
-                return isinstance(arg, tuple) and \
-                       isinstance(kw, dict) and \
-                       all(_is_str_any_dict(kw))
+        i = self._find_bind(func, binds, kw)
+        if i < 0:
+            raise ValueError("This signal is not connected to this function with the specified binds")
 
-        return False
+        if binds or kw:
+            self._nbound -= 1
+        del self._fns[i], self._args[i], self._kws[i]
 
     def emit(self, *args, **kw):
         """
@@ -141,17 +187,25 @@ class signal:
         `\*args` and `\*\*kw` from this function, and `\*args` and `\*\*kw` from
         :py:meth:`connect`.
         """
-        for obv in self._observers:
-            assert self._is_signal_bind(obv), "argument is not a signal binding"
-
-            # Is a signal bind (tuple with a function, *args, and **kw)
-            fn, sargs, skw = obv
-            args = args + sargs
-            kw.update(skw)
-
-            # Call function with appended arguments
+        fns = self._fns
+        if not fns:
+            return
+
+        obj = self.obj
+        if not self._nbound:
+            # No binds, so call each function with the arguments as-is
+            for fn in fns:
+                fn(obj, *args, **kw)
+            return
+
+        for fn, sargs, skw in zip(fns, self._args, self._kws):
+            # Call function with appended arguments; each function
+            # only gets its own binds
             fn = cast(_signal_function, fn)
-            fn(self.obj, *args, **kw)
+            if skw:
+                fn(obj, *args, *sargs, **{**kw, **skw})
+            else:
+                fn(obj, *args, *sargs, **kw)
 
     def __str__(self) -> str:
         return self.name
@@ -1,4 +1,6 @@
-from typing import Protocol, overload, Any
+from typing import Protocol, overload, Any, Iterable
+
+class InvalidSignalError(Exception): ...
 
 class _signal_function(Protocol):
     def __call__(self, obj: object, *args: Any, **kw: Any) -> None:
@@ -26,6 +28,9 @@ class signal:
     def connect(self, func: _signal_function, *binds: Any, **kw: Any) -> None:
         ...
 
+    def connect_many(self, items: Iterable[tuple[_signal_function, tuple[Any, ...], dict[str, Any]]]) -> None:
+        ...
+
     def disconnect(self, func: _signal_function, *binds: Any, **kw: Any) -> None:
         ...
 
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from ..interface import _WidgetMixin, _FrameMethod
+from tkinter import ttk
+
+def test_forwarded_methods_subclass():
+    class Widget(ttk.Entry, _WidgetMixin):
+        def grid(self, **kw): # pyright: ignore
+            pass
+
+    class Child(Widget):
+        pass
+
+    class GrandChild(Child):
+        pass
+
+    assert Widget._forwarded_methods # pyright: ignore
+    assert 'grid' not in Widget._forwarded_methods # pyright: ignore
+    assert 'pack' in Widget._forwarded_methods # pyright: ignore
+
+    # Subclasses forward the same methods as the widget they extend
+    for cls in (Child, GrandChild):
+        assert cls._forwarded_methods == Widget._forwarded_methods # pyright: ignore
+        assert isinstance(vars(cls)['pack'], _FrameMethod)
@@ -53,6 +53,80 @@ def test_signals():
     Missy.on_fed.disconnect(_on_animal_fed)
     assert Missy.on_fed.count == 0
 
+def test_binds():
+    calls = []
+
+    def _record(obj: object, *args: Any, **kw: Any):
+        calls.append((args, kw))
+
+    on_event = signal("event")
+    on_event.connect(_record, 1, tag="a")
+    on_event.connect(_record, 2)
+
+    on_event.emit("x", value=0)
+    assert calls == [
+        (("x", 1), {'value': 0, 'tag': "a"}),
+        (("x", 2), {'value': 0})
+    ]
+
+def test_plain_and_bound_order():
+    calls = []
+
+    def _first(obj: object, *args: Any, **kw: Any):
+        calls.append(("first", args))
+
+    def _second(obj: object, *args: Any, **kw: Any):
+        calls.append(("second", args))
+
+    on_event = signal("event")
+    on_event.connect(_first)
+    on_event.connect(_second, 2)
+    on_event.emit(1)
+    on_event.disconnect(_second, 2)
+    on_event.connect(_second)
+    on_event.emit(1)
+
+    # Connection order is kept whether or not binds are used
+    assert calls == [
+        ("first", (1,)), ("second", (1, 2)),
+        ("first", (1,)), ("second", (1,))
+    ]
+
+def test_connect_many():
+    Fido = Dog()
+    Fido.on_fed.connect_many([
+        (_on_animal_fed, (), {}),
+        (_on_animal_fed, ("bound",), {})
+    ])
+    assert Fido.on_fed.count == 2
+
+    with pytest.raises(ValueError):
+        Fido.on_fed.connect_many([(_on_animal_fed, (), {})])
+
+    with pytest.raises(TypeError):
+        Fido.on_fed.connect_many([(4, (), {})]) # pyright: ignore
+
+    # A bad item leaves the signal unchanged
+    with pytest.raises(TypeError):
+        Fido.on_fed.connect_many([(_on_animal_fed, ("a",), {}), (4, (), {})]) # pyright: ignore
+    with pytest.raises(ValueError):
+        Fido.on_fed.connect_many([(_on_animal_fed, ("b",), {}), (_on_animal_fed, ("b",), {})])
+    assert Fido.on_fed.count == 2
+
+    # Binds are normalized like those given to connect
+    Fido.on_fed.connect_many([(_on_animal_fed, ["list"], {})]) # pyright: ignore
+    Fido.on_fed.disconnect(_on_animal_fed, "list")
+    assert Fido.on_fed.count == 2
+
+def test_default_owner():
+    def _make(self=None):
+        return signal("made")
+
+    # The owner is resolved on every call, not remembered per function
+    assert _make().obj is sys.modules[__name__]
+    owner = object()
+    assert _make(owner).obj is owner
+
 def test_strings():
     on_edit = signal("edit")
     assert str(on_edit) == "edit"
@@ -1,7 +1,7 @@
 from __future__ import annotations
-from ..utils import attr_dict, Filesize, binary_search, readonly_dict, get_env
-from ..errors import ConstantError
-from ..logging import init, get_logger, Level
+from ..utils import attr_dict, Filesize, binary_search, readonly_dict, get_env, \
+    get_env_cached, ConstantError
+from ..logging import get_logger, Level
 from pathlib import Path
 import pytest, random, pickle
 
@@ -9,12 +9,27 @@ def test_attrdict():
     d = attr_dict()
     d['one'] = 1
     assert d.one == 1
+    assert not hasattr(d, 'two')
+    assert getattr(d, 'two', 2) == 2
+    with pytest.raises(AttributeError):
+        d.two
 
 def test_readonlydict():
     d = readonly_dict(one=1, two=2)
     with pytest.raises(ConstantError):
         d['three'] = 3
 
+    for method, args in [('__delitem__', ('one',)), ('update', ({'one': 3},)),
+                         ('setdefault', ('three', 3)), ('pop', ('one',)),
+                         ('popitem', ()), ('clear', ())]:
+        with pytest.raises(ConstantError):
+            getattr(d, method)(*args)
+
+    with pytest.raises(ConstantError):
+        d |= {'three': 3}
+
+    assert d == {'one': 1, 'two': 2}
+
 @pytest.mark.parametrize(
     "varname,expected",
     [
@@ -30,6 +45,17 @@ def test_getenv(varname: str, expected: str):
     assert val is not None, f"no value for env var '{varname}'"
     assert val == expected
 
+def test_getenv_cached(monkeypatch):
+    get_env_cached.cache_clear()
+    monkeypatch.setenv('JSNAKE_CACHED', "one")
+    assert get_env_cached('JSNAKE_CACHED') == "one"
+
+    # Changes are only seen after the cache is cleared
+    monkeypatch.setenv('JSNAKE_CACHED', "two")
+    assert get_env_cached('JSNAKE_CACHED') == "one"
+    get_env_cached.cache_clear()
+    assert get_env_cached('JSNAKE_CACHED') == "two"
+
 class TestFilesizeClass:
     @pytest.mark.parametrize(
         "string,size,unit,raw_size,approximate",
@@ -41,13 +67,19 @@ class TestFilesizeClass:
 
             ("~30 kb", 30.0, 'kb', 30720.0, True),
             ("~30 mb", 30.0, 'mb', 31457280.0, True),
-            ("~30 gb", 30.0, 'gb', 32212254720.0, True)
+            ("~30 gb", 30.0, 'gb', 32212254720.0, True),
+
+            ("30mb", 30.0, 'mb', 31457280.0, False),
+            ("30 MB", 30.0, 'mb', 31457280.0, False),
+            ("size: 30 Kb", 30.0, 'kb', 30720.0, False),
+            ("size: ~30 kb", 30.0, 'kb', 30720.0, True)
         ]
     )
     def test_fromstring(self, string: str, size: float,
                         unit: str, raw_size: float, approximate: bool):
         fs = Filesize.from_string(string)
         assert fs.size == size
+        assert fs.unit == unit
         assert fs.raw_byte_size == raw_size
         assert fs.approximate == approximate
 
@@ -62,6 +94,21 @@ class TestFilesizeClass:
         assert str(fs) == "3.0 mb"
         assert str(fs2) == "6.0 mb"
 
+    def test_defaults(self):
+        fs = Filesize()
+        assert (fs.size, fs.raw_byte_size, fs.unit, fs.approximate) == (0.0, 0.0, 'b', False)
+        assert str(fs) == "0 b"
+        assert Filesize(3.0, unit='kb') == Filesize(3.0, 0.0, 'kb', False)
+
+    def test_value_type(self):
+        fs = Filesize.from_string("3 mb")
+        assert fs == Filesize.from_value(3145728.0)
+        assert len({fs, Filesize.from_string("3mb")}) == 1
+        assert pickle.loads(pickle.dumps(fs)) == fs
+
+        with pytest.raises(AttributeError):
+            fs.size = 4.0 # pyright: ignore
+
     @pytest.mark.parametrize(
         "value,approximate,expected",
         [
@@ -85,9 +132,15 @@ class TestBinarySearch:
         assert binary_search(array, 300) > 0
         assert binary_search(array, -2) < 0
 
-    def test_strings(self, capsys):
-        init('jsnake')
+    def test_every_index(self):
+        array = list(range(0, 200, 3))
+        for i, v in enumerate(array):
+            assert binary_search(array, v) == i
+        assert binary_search(array, 1) < 0
+        assert binary_search(array, 1000) < 0
+        assert binary_search([], 1) < 0
 
+    def test_strings(self, capsys):
         fp = Path(__file__).parent / "_500_random_words.pickle"
 
         array: list[str]
@@ -1,11 +1,55 @@
 """Utility functions and classes."""
 
 from __future__ import annotations
-from typing import cast, Literal, Any
+from typing import Literal, Any
+from bisect import bisect_left
+from functools import lru_cache
+from dataclasses import dataclass
 import os, re
 
 _SizeUnit = Literal['b', 'kb', 'mb', 'gb']
 
+# Regexp: Parse one or more numbers followed by optional
+# whitespace and a suffix composed of any one of the letters
+# m, M, g, G, k, or K, followed by a b or B.
+_FILESIZE_RE = re.compile(r'~?([1-9][0-9]*)\s*([mMgGkK]?[bB])')
+
+# Size units, each 2**10 times the one before it
+_SUFFIXES: tuple[_SizeUnit, ...] = ('b', 'kb', 'mb', 'gb')
+_UNIT_INDEX: dict[str, int] = {'b': 0, 'kb': 1, 'mb': 2, 'gb': 3}
+_MULTIPLIERS = (1.0, 1024.0, 1048576.0, 1073741824.0)
+_RECIPROCALS = (1.0, 1 / 1024.0, 1 / 1048576.0, 1 / 1073741824.0)
+
+@lru_cache(maxsize=128)
+def _parse_filesize(string: str) -> tuple[float, float, _SizeUnit, bool]:
+    # Cached so that repeated strings skip parsing; returns the
+    # fields of a Filesize rather than an instance so from_string
+    # can build any subclass
+
+    # Fast path: the whole string is a size, "~?<digits>\s*<unit>"
+    approximate = string[:1] == '~'
+    body = string[1:] if approximate else string
+    rest = body.lstrip('0123456789')
+    num = body[:len(body) - len(rest)]
+    if num and num[0] != '0':
+        index = _UNIT_INDEX.get(rest.lstrip().lower())
+        if index is not None:
+            size = float(num)
+            return size, size * _MULTIPLIERS[index], _SUFFIXES[index], approximate
+
+    # Anything else, such as a size embedded in a longer string
+    m = _FILESIZE_RE.search(string)
+    if m is None:
+        raise ValueError(f"invalid string '{string}'")
+    num, unit = m.group(1, 2)
+
+    # A ~ at the beginning of the matched substring means
+    # the size is approximate. The unit is swapped for the
+    # interned, lowercase literal from _SUFFIXES.
+    index = _UNIT_INDEX[unit.lower()]
+    size = float(num)
+    return size, size * _MULTIPLIERS[index], _SUFFIXES[index], m.group(0)[0] == '~'
+
 # Exceptions
 #
 
@@ -15,6 +59,7 @@ class ConstantError(RuntimeError):
 # Classes
 #
 
+@dataclass(frozen=True, init=False)
 class Filesize:
     """
     A representation of a file size.
@@ -38,27 +83,46 @@ class Filesize:
        str(fs) # "1 kb"
     """
 
-    def __init__(self, size=0.0, raw_byte_size=0.0, unit: _SizeUnit='b',
-                 approximate: bool = False):
-        self.size = size #: Size value
-        self.raw_byte_size = raw_byte_size #: Size in bytes
-        self.unit = unit #: Size unit
-        self.approximate = approximate #: True if size is approximate
+    # _str is not a field; it caches the result of __str__
+    __slots__ = ('size', 'raw_byte_size', 'unit', 'approximate', '_str')
+
+    size: float #: Size value
+    raw_byte_size: float #: Size in bytes
+    unit: _SizeUnit #: Size unit
+    approximate: bool #: True if size is approximate
+
+    # Written by hand because field defaults would clash with
+    # __slots__, and dataclass(slots=True) needs Python 3.10
+    def __init__(self, size: float = 0.0, raw_byte_size: float = 0.0,
+                 unit: _SizeUnit = 'b', approximate: bool = False):
+        setattr_ = object.__setattr__
+        setattr_(self, 'size', size)
+        setattr_(self, 'raw_byte_size', raw_byte_size)
+        setattr_(self, 'unit', unit)
+        setattr_(self, 'approximate', approximate)
 
     def __str__(self) -> str:
+        try:
+            return self._str
+        except AttributeError:
+            pass
+
         size = self.size
         if self.unit == 'b':
             size = int(size)
 
-        return "{}{} {}".format(
-            "~" if self.approximate else "",
-            str(size),
-            self.unit
-        )
+        result = f"{'~' if self.approximate else ''}{size} {self.unit}"
+        object.__setattr__(self, '_str', result)
+        return result
 
     def __repr__(self) -> str:
         return f"Filesize(size={self.size!r}, {self.raw_byte_size!r}, {self.unit!r}, {self.approximate!r})"
 
+    def __reduce__(self):
+        # The default protocol restores slots with setattr,
+        # which a frozen dataclass refuses
+        return (type(self), (self.size, self.raw_byte_size, self.unit, self.approximate))
+
     def __add__(self, other: Filesize, /):
         raw_size = other.raw_byte_size + self.raw_byte_size
         return self.from_value(raw_size)
@@ -74,9 +138,9 @@ class Filesize:
                            number and unit can be separated by
                            whitespace, not it is not neccessary.
                            The unit can be ``b``, ``kb``, ``mb``,
-                           or ``gb``. If the first character is
-                           a ``~``, then the value is considered
-                           approximate
+                           or ``gb``, in any case. If the first
+                           character is a ``~``, then the value
+                           is considered approximate
 
         :return: An object representing the size denoted in `string`.
         :rtype: Filesize
@@ -90,43 +154,7 @@ class Filesize:
         >>> Filesize.from_string('~30 kb')
         '~30.0 kb'
         """
-        # Regexp: Parse one or more numbers followed by optional
-        # whitespace and a suffix composed of any one of the letters
-        # m, M, g, G, k, or K, followed by a b or B.
-        m = re.search(r'~?([1-9][0-9]*)\s*([mMgGkK]?[bB])', string)
-        if m is None:
-            raise ValueError(f"invalid string '{string}'")
-        num, unit =  m.group(1, 2)
-
-        # Search for a ~ at the beginning of the matched substring
-        approximate = False
-        if m.group(0)[0] == '~':
-            # ~ is found, thus size is approximate
-            approximate = True
-
-        assert isinstance(unit, str)
-        assert unit in ['b', 'kb', 'mb', 'gb']
-
-        # Type checker conversion
-        unit = cast(_SizeUnit, unit)
-
-        # Mapping of multipliers
-        multipliers = {
-            'b': 1.0,
-            'kb': 1024.0,
-            'mb': 1048576.0,
-            'gb': 1073741824.0
-        }
-
-        # Construct class
-        obj = cls()
-
-        obj.size = float(num)
-        obj.unit = unit
-        obj.raw_byte_size = float(num) * multipliers[unit]
-        obj.approximate = approximate
-
-        return obj
+        return cls(*_parse_filesize(string))
 
     @classmethod
     def from_value(cls, value: float, approximate: bool=False):
@@ -145,22 +173,13 @@ class Filesize:
         >>> Filesize.from_string("~5 kb")
         Filesize(size=5.0, 5120.0, 'kb', True)
         """
-        raw_size = value
-        suffixes = ('b', 'kb', 'mb', 'gb')
-        i = 0
-        while value >= 1024.0:
-            value /= 1024.0
-            i += 1
-
-        # Construct class
-        obj = cls()
+        # Each unit is 2**10 times the last, so the unit follows
+        # from the bit length of the integer part. The reciprocals
+        # are powers of two, so the product is exact.
+        raw_int = int(value)
+        i = 0 if raw_int < 1024 else min((raw_int.bit_length() - 1) // 10, 3)
 
-        obj.size = round(value, 2)
-        obj.unit = suffixes[i]
-        obj.raw_byte_size = raw_size
-        obj.approximate = approximate
-
-        return obj
+        return cls(round(value * _RECIPROCALS[i], 2), value, _SUFFIXES[i], approximate)
 
 class attr_dict(dict[str, Any]):
     """
@@ -174,17 +193,19 @@ class attr_dict(dict[str, Any]):
     1
     """
 
-    def __raise_if_not_string(self, key: str, /) -> None:
-        if not isinstance(key, str):
-            raise TypeError(f"invalid key '{key}', not a string")
+    __slots__ = ()
 
+    # Attribute names are always strings, so no type check is needed.
+    # A missing key raises AttributeError so hasattr() and getattr()
+    # with a default behave as expected.
     def __getattr__(self, key: str) -> Any:
-        self.__raise_if_not_string(key)
-        return self[key]
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            raise AttributeError(key) from None
 
-    def __setattr__(self, key: str, value) -> None:
-        self.__raise_if_not_string(key)
-        self[key] = value
+    # Attribute assignment is item assignment, so use dict's own method
+    __setattr__ = dict.__setitem__ # pyright: ignore
 
 class readonly_dict(dict[str, Any]):
     """
@@ -192,11 +213,17 @@ class readonly_dict(dict[str, Any]):
 
     The only difference between this and a normal
     ``dict`` is that :py:exc:`ConstantError` is raised
-    should the user attempt to set an item after initialization.
+    should the user attempt to set, delete or otherwise modify
+    an item after initialization.
     """
 
-    def __setitem__(self, key, value): # pyright: ignore
-        raise ConstantError(f"cannot assign elements to {type(self).__name__}")
+    __slots__ = ()
+
+    def __setitem__(self, *args, **kw): # pyright: ignore
+        raise ConstantError(f"cannot modify elements of {type(self).__name__}")
+
+    # Every mutating method raises the same error
+    __delitem__ = update = setdefault = pop = popitem = clear = __ior__ = __setitem__ # pyright: ignore
 
 # Functions
 #
@@ -205,10 +232,10 @@ def binary_search(array, pattern) -> int:
     """
     Do a binary search in an array.
 
-    :param list array: an array of values. Its contents must
-                       be of a type that supports ``>``
-                       and ``==`` operators. Its contents
-                       must also be sorted from lowest to highest
+    :param Sequence array: an array of values. Its contents must
+                           be of a type that supports ``<``
+                           and ``==`` operators. Its contents
+                           must also be sorted from lowest to highest
 
     :param pattern: the pattern to search for in `array`. It
                     should be the same type as `array`'s contents
@@ -219,28 +246,11 @@ def binary_search(array, pattern) -> int:
              on failure
     :rtype: int
     """
-    res = -1
-    low, high = 0, len(array)-1
-
-    if low > high: return -1
-
-    while (high - low) > 1:
-        mid = (high + low) // 2
-
-        v = array[mid]
-        if v == pattern:
-            return mid
-        elif v < pattern:
-            low = mid + 1
-        else:
-            high = mid - 1
+    i = bisect_left(array, pattern)
+    if i != len(array) and array[i] == pattern:
+        return i
 
-    if array[low] == pattern:
-        res = low
-    elif array[high] == pattern:
-        res = high
-
-    return res
+    return -1
 
 def get_env(envname: str) -> str | None:
     """
@@ -253,3 +263,19 @@ def get_env(envname: str) -> str | None:
     :rtype: str or None
     """
     return os.getenv(envname)
+
+@lru_cache(maxsize=256)
+def get_env_cached(envname: str) -> str | None:
+    """
+    Like :py:func:`get_env`, but remember the result for each `envname`.
+
+    Later changes to the environment are not seen until
+    ``get_env_cached.cache_clear()`` is called.
+
+    :param str envname: a variable defined in the environment
+
+    :return: the string value of `envname` if `envname` is set,
+             or ``None`` otherwise
+    :rtype: str or None
+    """
+    return get_env(envname)
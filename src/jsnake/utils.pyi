@@ -1,16 +1,24 @@
 from typing import Literal, Any
-from typing import Any, NoReturn
+from typing import Any, NoReturn, Sequence
 from typing_extensions import Self
+from functools import lru_cache
+from dataclasses import dataclass
 
 class ConstantError(RuntimeError):
     ...
 
+@dataclass(frozen=True)
 class Filesize:
     size: float
-    unit: Literal['b', 'kb', 'mb', 'gb']
     raw_byte_size: float
+    unit: Literal['b', 'kb', 'mb', 'gb']
     approximate: bool
 
+    def __init__(self, size: float = 0.0, raw_byte_size: float = 0.0,
+                 unit: Literal['b', 'kb', 'mb', 'gb'] = 'b',
+                 approximate: bool = False) -> None:
+        ...
+
     def __add__(self, other: Filesize, /) -> Self:
         ...
 
@@ -33,8 +41,33 @@ class readonly_dict(dict[str, Any]):
     def __setitem__(self, key, value) -> NoReturn: # pyright: ignore
         ...
 
-def binary_search(array: list[Any], pattern: Any) -> int:
+    def __delitem__(self, key) -> NoReturn: # pyright: ignore
+        ...
+
+    def __ior__(self, value) -> NoReturn: # pyright: ignore
+        ...
+
+    def update(self, *args, **kw) -> NoReturn: # pyright: ignore
+        ...
+
+    def setdefault(self, key, default=None) -> NoReturn: # pyright: ignore
+        ...
+
+    def pop(self, key, *args) -> NoReturn: # pyright: ignore
+        ...
+
+    def popitem(self) -> NoReturn: # pyright: ignore
+        ...
+
+    def clear(self) -> NoReturn: # pyright: ignore
+        ...
+
+def binary_search(array: Sequence[Any], pattern: Any) -> int:
     ...
 
 def get_env(envname: str) -> str | None:
     ...
+
+@lru_cache(maxsize=256)
+def get_env_cached(envname: str) -> str | None:
+    ...